@@ -3,10 +3,11 @@ import requests
 import json
 
 class AgentforceClient:
-    def __init__(self, token, instance, model_id):
+    def __init__(self, token, instance, model_id, session=None):
         self.token = token
         self.instance = instance  
         self.model_id = model_id
+        self.session = session or requests.Session()
 
     def get_completion(self, messages, max_tokens=256, temperature=0.0):
         """Get completion from the model with improved prompt handling"""
@@ -42,7 +43,7 @@ class AgentforceClient:
         }
         
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=30)
+            resp = self.session.post(url, json=payload, headers=headers, timeout=30)
             resp.raise_for_status()
             result = resp.json()
             return result['generation']['generatedText']
@@ -1,9 +1,15 @@
 """FastAPI app exposing the exception-fix endpoint."""
+import threading
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from .orchestrator import process_exception
+from .settings import get_settings
+from .warmup import run_warmup, warmup_state
 
 class ExceptionRequest(BaseModel):
     exception_id: str
@@ -16,7 +22,15 @@ class ExceptionResponse(BaseModel):
     exception_id: str
     pr_url: str = None
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load settings eagerly and run the optional warm-up on a daemon thread.
+    The server accepts traffic immediately; /ready reports when warm-up has finished."""
+    get_settings()
+    threading.Thread(target=run_warmup, name='warmup', daemon=True).start()
+    yield
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,6 +40,11 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization"],
 )
 
+@app.get('/ready')
+def readiness():
+    """Readiness probe: 200 once warm-up has finished, 503 while it is still running."""
+    return JSONResponse(status_code=200 if warmup_state.ready else 503, content=warmup_state.snapshot())
+
 @app.post('/solve', response_model=ExceptionResponse)
 def solve_exception(req: ExceptionRequest):
     """
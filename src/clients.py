@@ -0,0 +1,106 @@
+"""Lazily constructed, process-wide client registry.
+
+Each accessor builds its client from `get_settings()` on first use and returns the same
+instance afterwards, so importing a module never touches the network or the environment.
+Creation is guarded by a lock because warm-up threads and request threads may race for
+the first instance.
+
+Sessions are shared between FastAPI's threadpool workers and the warm-up threads. Their cookie
+jars reject every cookie, so no response can leak state into later requests from other threads;
+clients pass headers/auth explicitly per call and the urllib3 connection pool is thread-safe.
+"""
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .agentforce_client import AgentforceClient
+from .jira_creator      import JiraCreator
+from .patch_engine      import PatchEngine
+from .pr_creator        import PRCreator
+from .settings          import get_settings
+from .snippet_fetcher   import SnippetFetcher
+
+# Matches the default size of the threadpool FastAPI runs sync endpoints on
+POOL_MAXSIZE = 40
+
+# Re-entrant: building a client also builds the session it depends on
+_lock      = threading.RLock()
+_instances = {}
+
+
+def _get_or_create(name, factory):
+    instance = _instances.get(name)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(name)
+            if instance is None:
+                instance = factory()
+                _instances[name] = instance
+    return instance
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    # Every call is authenticated explicitly, so cookies such as BrowserId are never needed
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_salesforce_session() -> requests.Session:
+    """Shared HTTP session for Salesforce REST calls (Agentforce models and record updates)."""
+    return _get_or_create('salesforce_session', _new_session)
+
+
+def get_github_session() -> requests.Session:
+    """Shared HTTP session for GitHub REST calls (class fetches and pull requests)."""
+    return _get_or_create('github_session', _new_session)
+
+
+def get_jira_session() -> requests.Session:
+    """Shared HTTP session for JIRA REST calls."""
+    return _get_or_create('jira_session', _new_session)
+
+
+def get_agent_client() -> AgentforceClient:
+    def build():
+        settings = get_settings()
+        return AgentforceClient(settings.sf_access_token, settings.sf_api_endpoint, settings.model_id,
+                                session=get_salesforce_session())
+    return _get_or_create('agent_client', build)
+
+
+def get_snippet_fetcher() -> SnippetFetcher:
+    def build():
+        settings = get_settings()
+        return SnippetFetcher(settings.git_token, settings.git_repo, settings.git_branch,
+                              session=get_github_session())
+    return _get_or_create('snippet_fetcher', build)
+
+
+def get_pr_creator() -> PRCreator:
+    def build():
+        settings = get_settings()
+        return PRCreator(settings.git_token, settings.git_repo, session=get_github_session())
+    return _get_or_create('pr_creator', build)
+
+
+def get_jira_creator() -> JiraCreator:
+    def build():
+        settings = get_settings()
+        return JiraCreator(settings.jira_base_url, settings.jira_email, settings.jira_api_token,
+                           settings.jira_project_key, settings.jira_issue_type,
+                           session=get_jira_session())
+    return _get_or_create('jira_creator', build)
+
+
+def new_patch_engine() -> PatchEngine:
+    """PatchEngine works in a throwaway clone, so a fresh instance is built per fix."""
+    settings = get_settings()
+    return PatchEngine(settings.git_token, settings.git_repo, settings.git_branch,
+                       settings.git_user_email, settings.git_user_name,
+                       mirror_dir=settings.git_mirror_dir)
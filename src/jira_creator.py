@@ -1,18 +1,16 @@
 # src/jira_creator.py
-import os
 import requests
 from requests.auth import HTTPBasicAuth
-from dotenv import load_dotenv
 
 class JiraCreator:
-    def __init__(self):
-        load_dotenv()  # Ensure environment variables are loaded
-        self.base_url   = os.getenv('JIRA_BASE_URL')
-        self.email      = os.getenv('JIRA_EMAIL')
-        self.api_token  = os.getenv('JIRA_API_TOKEN')
-        self.project    = os.getenv('JIRA_PROJECT_KEY')
-        self.issue_type = os.getenv('JIRA_ISSUE_TYPE', 'Task')
+    def __init__(self, base_url, email, api_token, project, issue_type='Task', session=None):
+        self.base_url   = base_url
+        self.email      = email
+        self.api_token  = api_token
+        self.project    = project
+        self.issue_type = issue_type
         self.auth       = HTTPBasicAuth(self.email, self.api_token)
+        self.session    = session or requests.Session()
         self.headers    = {
             'Accept': 'application/json',
             'Content-Type': 'application/json'
@@ -46,7 +44,7 @@ class JiraCreator:
                 "issuetype":   {"name": self.issue_type}
             }
         }
-        resp = requests.post(url, json=payload, headers=self.headers, auth=self.auth)
+        resp = self.session.post(url, json=payload, headers=self.headers, auth=self.auth)
         resp.raise_for_status()
         data = resp.json()
         return f"{self.base_url}/browse/{data['key']}"
@@ -1,31 +1,15 @@
-import os
 import json
 import uuid
-from dotenv import load_dotenv
 
-from .agentforce_client import AgentforceClient
-from .snippet_fetcher   import SnippetFetcher
-from .patch_engine      import PatchEngine
-from .pr_creator        import PRCreator
-from .jira_creator      import JiraCreator
-from .sf_updater        import update_exception_record
-
-load_dotenv()
-
-SF_INSTANCE = os.getenv('SF_INSTANCE')
-SF_API_ENDPOINT = os.getenv('SF_API_ENDPOINT')
-SF_TOKEN    = os.getenv('SF_ACCESS_TOKEN')
-MODEL_ID    = os.getenv('MODEL_ID')
-
-GIT_TOKEN = os.getenv('GIT_TOKEN')
-GIT_REPO  = os.getenv('GIT_REPO')
-
-agent_client    = AgentforceClient(SF_TOKEN, SF_API_ENDPOINT, MODEL_ID)
-snippet_fetcher = SnippetFetcher()
-pr_creator      = PRCreator(GIT_TOKEN, GIT_REPO)
-jira_creator    = JiraCreator()
+from .clients    import get_agent_client, get_snippet_fetcher, get_pr_creator, get_jira_creator, new_patch_engine
+from .sf_updater import update_exception_record
 
 def process_exception(exception_id: str, exception_message: str, stack_trace: str) -> str:
+    agent_client    = get_agent_client()
+    snippet_fetcher = get_snippet_fetcher()
+    pr_creator      = get_pr_creator()
+    jira_creator    = get_jira_creator()
+
     print(f"🔍 Processing exception {exception_id}: {exception_message}")
     print(f"📋 Stack trace: {stack_trace}")
     
@@ -271,7 +255,7 @@ def process_exception(exception_id: str, exception_message: str, stack_trace: st
     branch = f"fix/{class_name}-{uuid.uuid4().hex[:8]}"
     
     try:
-        with PatchEngine() as patch_engine:
+        with new_patch_engine() as patch_engine:
             patch_engine.create_branch(branch)
             
             # Apply fixes for all classes returned by LLM
@@ -2,17 +2,57 @@ import subprocess
 import tempfile
 import os
 import shutil
-from dotenv import load_dotenv
+import base64
+
+
+def _auth_config(git_token):
+    """Per-command `git -c` args carrying the token, so it is never written to a repo config."""
+    credentials = base64.b64encode(f"x-access-token:{git_token}".encode()).decode()
+    return ['-c', f"http.https://github.com/.extraHeader=Authorization: Basic {credentials}"]
+
+
+def mirror_ready(mirror_dir):
+    """A mirror only appears at `mirror_dir` once fully cloned (see prime_git_mirror)."""
+    return bool(mirror_dir) and os.path.isdir(os.path.join(mirror_dir, 'objects'))
+
+
+def prime_git_mirror(git_token, git_repo, mirror_dir):
+    """
+    Create or refresh a local bare mirror of the repository at `mirror_dir`.
+    A new mirror is cloned into a sibling temp directory and moved into place only when complete,
+    so PatchEngine never borrows objects from a half-built mirror.
+    """
+    repo_url = f"https://github.com/{git_repo}.git"
+    if mirror_ready(mirror_dir):
+        subprocess.run([
+            'git', *_auth_config(git_token), '-c', 'gc.auto=0',
+            '-C', mirror_dir, 'fetch', '--prune', 'origin'
+        ], check=True)
+        return
+
+    parent_dir = os.path.dirname(os.path.abspath(mirror_dir))
+    os.makedirs(parent_dir, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(prefix='.mirror_', dir=parent_dir)
+    try:
+        subprocess.run([
+            'git', *_auth_config(git_token), 'clone', '--mirror', repo_url, staging_dir
+        ], check=True)
+        os.replace(staging_dir, mirror_dir)
+    finally:
+        if os.path.exists(staging_dir):
+            shutil.rmtree(staging_dir)
 
-load_dotenv()
 
 class PatchEngine:
-    def __init__(self):
-        self.git_token = os.getenv('GIT_TOKEN')
-        self.git_repo = os.getenv('GIT_REPO')
-        self.git_branch = os.getenv('GIT_BRANCH', 'main')
-        self.git_user_email = os.getenv('GIT_USER_EMAIL', 'selfhealing@example.com')
-        self.git_user_name = os.getenv('GIT_USER_NAME', 'Self-Healing Agent')
+    def __init__(self, git_token, git_repo, git_branch='main',
+                 git_user_email='selfhealing@example.com', git_user_name='Self-Healing Agent',
+                 mirror_dir=None):
+        self.git_token = git_token
+        self.git_repo = git_repo
+        self.git_branch = git_branch
+        self.git_user_email = git_user_email
+        self.git_user_name = git_user_name
+        self.mirror_dir = mirror_dir
         self.temp_dir = None
         self.original_dir = None
         
@@ -21,10 +61,15 @@ class PatchEngine:
         self.temp_dir = tempfile.mkdtemp(prefix='patch_engine_')
         self.original_dir = os.getcwd()
         
-        # Clone the repository
+        # Clone the repository, borrowing objects from the local mirror when it has been primed.
+        # The mirror only ever gains objects (fetch with gc disabled), and the clone is deleted on exit.
         repo_url = f"https://{self.git_token}@github.com/{self.git_repo}.git"
+        if mirror_ready(self.mirror_dir):
+            clone_args = ['--reference', self.mirror_dir]
+        else:
+            clone_args = ['--depth', '1']
         subprocess.run([
-            'git', 'clone', '--depth', '1', '--branch', self.git_branch, 
+            'git', 'clone', *clone_args, '--branch', self.git_branch, 
             repo_url, self.temp_dir
         ], check=True)
         
@@ -2,9 +2,10 @@
 import requests
 
 class PRCreator:
-    def __init__(self, token, repo):
+    def __init__(self, token, repo, session=None):
         self.token = token
         self.repo = repo
+        self.session = session or requests.Session()
 
     def create_pr(self, branch_name, title, body):
         url = f'https://api.github.com/repos/{self.repo}/pulls'
@@ -18,6 +19,6 @@ class PRCreator:
             'base': 'main',
             'body': body
         }
-        resp = requests.post(url, json=payload, headers=headers)
+        resp = self.session.post(url, json=payload, headers=headers)
         resp.raise_for_status()
         return resp.json().get('html_url')
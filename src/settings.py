@@ -0,0 +1,83 @@
+"""Typed, lazily loaded configuration for the self-healing agent."""
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env_list(name: str) -> Tuple[str, ...]:
+    value = os.getenv(name, '')
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+def _env_path(name: str) -> Optional[str]:
+    # Resolved once at load time: PatchEngine changes the process cwd while a fix runs
+    value = os.getenv(name)
+    return os.path.abspath(value) if value else None
+
+
+@dataclass(frozen=True)
+class Settings:
+    # Salesforce
+    sf_instance: Optional[str]
+    sf_api_endpoint: Optional[str]
+    sf_access_token: Optional[str]
+    model_id: Optional[str]
+
+    # Git
+    git_token: Optional[str]
+    git_repo: Optional[str]  # format: owner/repo
+    git_branch: str
+    git_user_email: str
+    git_user_name: str
+    git_mirror_dir: Optional[str]
+
+    # JIRA
+    jira_base_url: Optional[str]
+    jira_email: Optional[str]
+    jira_api_token: Optional[str]
+    jira_project_key: Optional[str]
+    jira_issue_type: str
+
+    # Startup warm-up
+    warmup_connections: bool
+    warmup_classes: Tuple[str, ...]
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """Build settings from the process environment (after loading `.env`)."""
+        load_dotenv()
+        return cls(
+            sf_instance=os.getenv('SF_INSTANCE'),
+            sf_api_endpoint=os.getenv('SF_API_ENDPOINT'),
+            sf_access_token=os.getenv('SF_ACCESS_TOKEN'),
+            model_id=os.getenv('MODEL_ID'),
+            git_token=os.getenv('GIT_TOKEN'),
+            git_repo=os.getenv('GIT_REPO'),
+            git_branch=os.getenv('GIT_BRANCH', 'main'),
+            git_user_email=os.getenv('GIT_USER_EMAIL', 'selfhealing@example.com'),
+            git_user_name=os.getenv('GIT_USER_NAME', 'Self-Healing Agent'),
+            git_mirror_dir=_env_path('GIT_MIRROR_DIR'),
+            jira_base_url=os.getenv('JIRA_BASE_URL'),
+            jira_email=os.getenv('JIRA_EMAIL'),
+            jira_api_token=os.getenv('JIRA_API_TOKEN'),
+            jira_project_key=os.getenv('JIRA_PROJECT_KEY'),
+            jira_issue_type=os.getenv('JIRA_ISSUE_TYPE', 'Task'),
+            warmup_connections=_env_bool('WARMUP_CONNECTIONS'),
+            warmup_classes=_env_list('WARMUP_CLASSES'),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading them on first use."""
+    return Settings.from_env()
@@ -1,18 +1,12 @@
 """Module to update Exception__c records in Salesforce."""
-import os
-import requests
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-SF_INSTANCE = os.getenv('SF_INSTANCE')
-SF_TOKEN    = os.getenv('SF_ACCESS_TOKEN')
+from .clients import get_salesforce_session
+from .settings import get_settings
 
 def update_exception_record(exception_id, pr_url, status):
-    url = f"{SF_INSTANCE}/services/data/v60.0/sobjects/ExceptionLogger__c/{exception_id}"
+    settings = get_settings()
+    url = f"{settings.sf_instance}/services/data/v60.0/sobjects/ExceptionLogger__c/{exception_id}"
     headers = {
-        "Authorization": f"Bearer {SF_TOKEN}",
+        "Authorization": f"Bearer {settings.sf_access_token}",
         "Content-Type": "application/json"
     }
     body = {
@@ -21,7 +15,7 @@ def update_exception_record(exception_id, pr_url, status):
     }
     
     try:
-        resp = requests.patch(url, json=body, headers=headers)
+        resp = get_salesforce_session().patch(url, json=body, headers=headers)
         resp.raise_for_status()
         print(f"✓ Successfully updated Salesforce record {exception_id}")
     except Exception as e:
@@ -1,14 +1,14 @@
-import os
 import requests
 
 class SnippetFetcher:
     """Fetch Apex class contents from remote Git repository, on demand, with simple per-class caching.
     Only handles Apex classes (.cls files) - triggers and other components are handled by the LLM logic."""
-    def __init__(self):
-        self.git_token = os.getenv('GIT_TOKEN')
-        self.git_repo  = os.getenv('GIT_REPO')  # format: owner/repo
-        self.branch    = os.getenv('GIT_BRANCH', 'main')
+    def __init__(self, git_token, git_repo, branch='main', session=None):
+        self.git_token = git_token
+        self.git_repo  = git_repo  # format: owner/repo
+        self.branch    = branch
         self.base_url  = f"https://api.github.com/repos/{self.git_repo}/contents"
+        self.session   = session or requests.Session()
         self._cache    = {}
 
     def fetch(self, class_name):
@@ -32,7 +32,7 @@ class SnippetFetcher:
         params = {'ref': self.branch}
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=headers, params=params)
             response.raise_for_status()
             content = response.text
         except requests.exceptions.RequestException as e:
@@ -48,3 +48,16 @@ class SnippetFetcher:
 
         self._cache[class_name] = content
         return content
+
+    def prefetch(self, class_names):
+        """
+        Warm the cache with `class_names` ahead of the first request.
+        Returns a dict of class name -> error message for classes that could not be fetched.
+        """
+        failures = {}
+        for class_name in class_names:
+            try:
+                self.fetch(class_name)
+            except Exception as e:
+                failures[class_name] = str(e)
+        return failures
@@ -0,0 +1,113 @@
+"""Optional startup warm-up so the first exception after a deploy does not pay cold-start costs.
+
+Each step is enabled through settings:
+- WARMUP_CONNECTIONS: open TLS connections to Salesforce, GitHub and JIRA ahead of time
+- WARMUP_CLASSES:     comma-separated Apex classes to pre-fetch into the snippet cache
+- GIT_MIRROR_DIR:     local bare mirror that PatchEngine clones against
+"""
+import threading
+
+from .clients      import (get_agent_client, get_github_session, get_jira_session,
+                           get_salesforce_session, get_snippet_fetcher)
+from .patch_engine import prime_git_mirror
+from .settings     import get_settings
+
+
+class WarmupState:
+    """Thread-safe record of warm-up progress, exposed through the readiness endpoint."""
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._steps = {}
+        self._done  = False
+
+    def start(self, step):
+        with self._lock:
+            self._steps[step] = {'status': 'running'}
+
+    def finish(self, step, error=None):
+        with self._lock:
+            self._steps[step] = {'status': 'failed', 'error': error} if error else {'status': 'done'}
+
+    def mark_done(self):
+        with self._lock:
+            self._done = True
+
+    @property
+    def ready(self):
+        with self._lock:
+            return self._done
+
+    def snapshot(self):
+        with self._lock:
+            return {'ready': self._done, 'steps': {name: dict(info) for name, info in self._steps.items()}}
+
+
+warmup_state = WarmupState()
+
+
+def _warm_connections():
+    """Build the clients and open one pooled connection per upstream host."""
+    settings = get_settings()
+    get_agent_client()
+    targets = [
+        (get_salesforce_session(), settings.sf_api_endpoint),
+        (get_salesforce_session(), settings.sf_instance),
+        (get_github_session(), 'https://api.github.com'),
+        (get_jira_session(), settings.jira_base_url),
+    ]
+    errors = []
+    for session, url in targets:
+        if not url:
+            continue
+        try:
+            # Any response is fine: the point is DNS, TCP and TLS, not the payload
+            session.head(url, timeout=10)
+        except Exception as e:
+            errors.append(f"{url}: {e}")
+    if errors:
+        raise RuntimeError('; '.join(errors))
+
+
+def _prefetch_classes():
+    failures = get_snippet_fetcher().prefetch(get_settings().warmup_classes)
+    if failures:
+        raise RuntimeError('; '.join(f"{name}: {error}" for name, error in failures.items()))
+
+
+def _prime_mirror():
+    settings = get_settings()
+    prime_git_mirror(settings.git_token, settings.git_repo, settings.git_mirror_dir)
+
+
+def _run_step(name, step):
+    warmup_state.start(name)
+    try:
+        step()
+    except Exception as e:
+        print(f"⚠️ Warm-up step {name} failed: {e}")
+        warmup_state.finish(name, str(e))
+    else:
+        print(f"✓ Warm-up step {name} completed")
+        warmup_state.finish(name)
+
+
+def run_warmup():
+    """Run every enabled warm-up step concurrently and mark the service ready when all finish.
+    Failed steps are reported but do not block readiness; requests simply fall back to the cold path."""
+    settings = get_settings()
+    steps = {}
+    if settings.warmup_connections:
+        steps['connections'] = _warm_connections
+    if settings.warmup_classes:
+        steps['class_snapshot'] = _prefetch_classes
+    if settings.git_mirror_dir:
+        steps['git_mirror'] = _prime_mirror
+
+    # Daemon threads, so a long clone or fetch never holds up server shutdown
+    threads = [threading.Thread(target=_run_step, args=(name, step), name=f"warmup-{name}", daemon=True)
+               for name, step in steps.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    warmup_state.mark_done()
@@ -0,0 +1,23 @@
+import dataclasses
+
+import pytest
+
+from src import settings as settings_module
+from src.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Keep a developer's .env and warm-up settings out of the tests."""
+    # load_dotenv() searches upward from src/settings.py, so the cwd does not matter
+    monkeypatch.setattr(settings_module, 'load_dotenv', lambda: None)
+    for name in ('WARMUP_CONNECTIONS', 'WARMUP_CLASSES', 'GIT_MIRROR_DIR', 'GIT_BRANCH', 'JIRA_ISSUE_TYPE'):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def make_settings():
+    """Build Settings with warm-up disabled unless overridden."""
+    def build(**overrides):
+        return dataclasses.replace(Settings.from_env(), **overrides)
+    return build
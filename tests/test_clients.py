@@ -0,0 +1,46 @@
+import threading
+from http.client import HTTPMessage
+
+import requests
+from requests.cookies import MockRequest, MockResponse
+
+from src import clients
+
+
+def test_concurrent_first_use_builds_one_instance(monkeypatch, make_settings):
+    monkeypatch.setattr(clients, '_instances', {})
+    monkeypatch.setattr(clients, 'get_settings', lambda: make_settings())
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(clients.get_snippet_fetcher())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(fetcher) for fetcher in results}) == 1
+    assert results[0].session is clients.get_github_session()
+
+
+def test_jira_creator_uses_registry_session(monkeypatch, make_settings):
+    monkeypatch.setattr(clients, '_instances', {})
+    monkeypatch.setattr(clients, 'get_settings', lambda: make_settings())
+
+    assert clients.get_jira_creator().session is clients.get_jira_session()
+
+
+def test_registry_sessions_reject_cookies(monkeypatch):
+    monkeypatch.setattr(clients, '_instances', {})
+    session = clients.get_salesforce_session()
+    headers = HTTPMessage()
+    headers['Set-Cookie'] = 'BrowserId=abc; Domain=.salesforce.com; Path=/'
+    request = requests.Request('GET', 'https://example.my.salesforce.com/services/data').prepare()
+
+    session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+    assert len(session.cookies) == 0
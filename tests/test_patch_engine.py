@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from src import patch_engine
+from src.patch_engine import PatchEngine, prime_git_mirror
+
+
+@pytest.fixture
+def git_calls(monkeypatch):
+    """Record git invocations; `clone` creates its target so mirror moves can be checked."""
+    calls = []
+
+    def fake_run(args, check):
+        calls.append(args)
+        if 'clone' in args:
+            os.makedirs(os.path.join(args[-1], 'objects'), exist_ok=True)
+    monkeypatch.setattr(patch_engine.subprocess, 'run', fake_run)
+    return calls
+
+
+def clone_call(calls):
+    return next(args for args in calls if 'clone' in args)
+
+
+def test_clone_is_shallow_without_mirror(git_calls):
+    with PatchEngine('tok', 'owner/repo'):
+        pass
+
+    args = clone_call(git_calls)
+    assert args[2:4] == ['--depth', '1']
+    assert '--reference' not in args
+
+
+def test_clone_is_shallow_while_mirror_is_missing(git_calls, tmp_path):
+    with PatchEngine('tok', 'owner/repo', mirror_dir=str(tmp_path / 'mirror')):
+        pass
+
+    assert '--depth' in clone_call(git_calls)
+
+
+def test_clone_references_ready_mirror(git_calls, tmp_path):
+    mirror_dir = tmp_path / 'mirror'
+    (mirror_dir / 'objects').mkdir(parents=True)
+
+    with PatchEngine('tok', 'owner/repo', mirror_dir=str(mirror_dir)):
+        pass
+
+    args = clone_call(git_calls)
+    assert args[2:4] == ['--reference', str(mirror_dir)]
+    assert '--depth' not in args
+
+
+def test_prime_builds_mirror_in_staging_dir_then_moves_it(git_calls, tmp_path):
+    mirror_dir = tmp_path / 'mirror'
+
+    prime_git_mirror('secret-token', 'owner/repo', str(mirror_dir))
+
+    staging_dir = clone_call(git_calls)[-1]
+    assert staging_dir != str(mirror_dir)
+    assert os.path.dirname(staging_dir) == str(tmp_path)
+    assert (mirror_dir / 'objects').is_dir()
+    assert os.listdir(tmp_path) == ['mirror']
+
+
+def test_prime_failure_leaves_no_mirror(monkeypatch, tmp_path):
+    def fail(args, check):
+        os.makedirs(os.path.join(args[-1], 'objects'), exist_ok=True)
+        raise RuntimeError('clone failed')
+    monkeypatch.setattr(patch_engine.subprocess, 'run', fail)
+
+    with pytest.raises(RuntimeError):
+        prime_git_mirror('secret-token', 'owner/repo', str(tmp_path / 'mirror'))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_prime_keeps_token_out_of_remote_url(git_calls, tmp_path):
+    mirror_dir = tmp_path / 'mirror'
+    prime_git_mirror('secret-token', 'owner/repo', str(mirror_dir))
+    prime_git_mirror('secret-token', 'owner/repo', str(mirror_dir))
+
+    assert clone_call(git_calls)[-2] == 'https://github.com/owner/repo.git'
+    assert any('fetch' in args for args in git_calls)
+    for args in git_calls:
+        assert not any('secret-token' in arg for arg in args)
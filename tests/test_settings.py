@@ -0,0 +1,37 @@
+import pytest
+
+from src.settings import Settings
+
+
+def test_defaults_when_unset():
+    settings = Settings.from_env()
+    assert settings.git_branch == 'main'
+    assert settings.jira_issue_type == 'Task'
+    assert settings.git_mirror_dir is None
+    assert settings.warmup_connections is False
+    assert settings.warmup_classes == ()
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('true', True), ('1', True), ('YES', True), (' on ', True),
+    ('false', False), ('0', False), ('', False), ('nope', False),
+])
+def test_warmup_connections_parsing(monkeypatch, value, expected):
+    monkeypatch.setenv('WARMUP_CONNECTIONS', value)
+    assert Settings.from_env().warmup_connections is expected
+
+
+def test_warmup_classes_parsing(monkeypatch):
+    monkeypatch.setenv('WARMUP_CLASSES', ' AccountService, ,ContactSelector,')
+    assert Settings.from_env().warmup_classes == ('AccountService', 'ContactSelector')
+
+
+def test_empty_mirror_dir_disables_mirror(monkeypatch):
+    monkeypatch.setenv('GIT_MIRROR_DIR', '')
+    assert Settings.from_env().git_mirror_dir is None
+
+
+def test_relative_mirror_dir_is_made_absolute(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('GIT_MIRROR_DIR', 'cache/mirror')
+    assert Settings.from_env().git_mirror_dir == str(tmp_path / 'cache' / 'mirror')
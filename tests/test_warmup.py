@@ -0,0 +1,57 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src import app as app_module
+from src import warmup
+
+
+@pytest.fixture
+def state(monkeypatch):
+    state = warmup.WarmupState()
+    monkeypatch.setattr(warmup, 'warmup_state', state)
+    monkeypatch.setattr(app_module, 'warmup_state', state)
+    return state
+
+
+def test_run_warmup_with_no_steps_is_ready(monkeypatch, state, make_settings):
+    monkeypatch.setattr(warmup, 'get_settings', lambda: make_settings())
+
+    warmup.run_warmup()
+
+    assert state.snapshot() == {'ready': True, 'steps': {}}
+
+
+def test_failed_step_is_reported_without_blocking_readiness(monkeypatch, state, make_settings):
+    monkeypatch.setattr(warmup, 'get_settings', lambda: make_settings(
+        warmup_classes=('AccountService',), git_mirror_dir='/tmp/mirror'))
+
+    def fail():
+        raise RuntimeError('AccountService: 404')
+    monkeypatch.setattr(warmup, '_prefetch_classes', fail)
+    monkeypatch.setattr(warmup, '_prime_mirror', lambda: None)
+
+    warmup.run_warmup()
+
+    snapshot = state.snapshot()
+    assert snapshot['ready'] is True
+    assert snapshot['steps'] == {
+        'class_snapshot': {'status': 'failed', 'error': 'AccountService: 404'},
+        'git_mirror': {'status': 'done'},
+    }
+
+
+def test_ready_endpoint_reports_warmup_progress(state):
+    # No `with` block, so the lifespan warm-up does not run
+    client = TestClient(app_module.app)
+    state.start('git_mirror')
+
+    response = client.get('/ready')
+    assert response.status_code == 503
+    assert response.json() == {'ready': False, 'steps': {'git_mirror': {'status': 'running'}}}
+
+    state.finish('git_mirror')
+    state.mark_done()
+
+    response = client.get('/ready')
+    assert response.status_code == 200
+    assert response.json() == {'ready': True, 'steps': {'git_mirror': {'status': 'done'}}}